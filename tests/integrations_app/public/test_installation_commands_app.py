@@ -15,8 +15,5 @@ def test_installation_commands_app_example_cloud() -> None:
         extra_args=["--setup"],
         debug=True,
     ) as (_, _, fetch_logs, _):
-        has_logs = False
-        while not has_logs:
-            for log in fetch_logs(["work"]):
-                if "lmdb successfully installed" in log:
-                    has_logs = True
+        while not any("lmdb successfully installed" in log for log in fetch_logs(["work"])):
+            pass
@@ -13,7 +13,6 @@
 # limitations under the License.
 import os
 import time
-from copy import deepcopy
 
 import torch
 import torch.distributed
@@ -46,7 +45,7 @@ def train_torch_ddp(
     torch.distributed.init_process_group(backend, rank=rank, world_size=world_size)
 
     model = ConvNet().to(device)
-    initial_state_dict = deepcopy(model.state_dict())
+    initial_state_dict = {k: v.detach().clone() for k, v in model.state_dict().items()}
 
     ddp_model = DistributedDataParallel(model, device_ids=([rank] if device.type == "cuda" else None))
 
@@ -56,12 +55,12 @@ def train_torch_ddp(
     optimizer = model.get_optimizer()
     loss_fn = model.get_loss_function()
 
-    memory_stats["start"] = torch.cuda.memory_stats()
+    memory_stats["start"] = torch.cuda.max_memory_allocated()
 
     ddp_model.train()
-    iteration_timings = []
+    iteration_timings = torch.empty(model.num_steps)
     iterator = iter(dataloader)
-    for _ in range(model.num_steps):
+    for i in range(model.num_steps):
         t0 = time.perf_counter()
 
         inputs, labels = next(iterator)
@@ -73,14 +72,14 @@ def train_torch_ddp(
         optimizer.step()
 
         t1 = time.perf_counter()
-        iteration_timings.append(t1 - t0)
+        iteration_timings[i] = t1 - t0
 
-    memory_stats["end"] = torch.cuda.memory_stats()
+    memory_stats["end"] = torch.cuda.max_memory_allocated()
 
     # check that the model has changed
     assert not is_state_dict_equal(initial_state_dict, ddp_model.module.state_dict())
 
-    return ddp_model.module.state_dict(), torch.tensor(iteration_timings), memory_stats
+    return ddp_model.module.state_dict(), iteration_timings, memory_stats
 
 
 def train_fabric_ddp(fabric):
@@ -88,7 +87,7 @@ def train_fabric_ddp(fabric):
     memory_stats = {}
 
     model = ConvNet()
-    initial_state_dict = deepcopy(model.state_dict())
+    initial_state_dict = {k: v.detach().clone() for k, v in model.state_dict().items()}
 
     optimizer = model.get_optimizer()
     model, optimizer = fabric.setup(model, optimizer)
@@ -97,12 +96,12 @@ def train_fabric_ddp(fabric):
     dataloader = fabric.setup_dataloaders(dataloader)
     loss_fn = model.get_loss_function()
 
-    memory_stats["start"] = torch.cuda.memory_stats()
+    memory_stats["start"] = torch.cuda.max_memory_allocated()
 
     model.train()
-    iteration_timings = []
+    iteration_timings = torch.empty(model.num_steps)
     iterator = iter(dataloader)
-    for _ in range(model.num_steps):
+    for i in range(model.num_steps):
         t0 = time.perf_counter()
 
         inputs, labels = next(iterator)
@@ -113,14 +112,14 @@ def train_fabric_ddp(fabric):
         optimizer.step()
 
         t1 = time.perf_counter()
-        iteration_timings.append(t1 - t0)
+        iteration_timings[i] = t1 - t0
 
-    memory_stats["end"] = torch.cuda.memory_stats()
+    memory_stats["end"] = torch.cuda.max_memory_allocated()
 
     # check that the model has changed
     assert not is_state_dict_equal(initial_state_dict, model.state_dict())
 
-    return model.state_dict(), torch.tensor(iteration_timings), memory_stats
+    return model.state_dict(), iteration_timings, memory_stats
 
 
 def run_parity_test(accelerator: str = "cpu", devices: int = 2, tolerance: float = 0.02):
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import time
-from copy import deepcopy
 from typing import Callable
 
 import pytest
@@ -47,12 +46,12 @@ def train_torch(
     optimizer = model.get_optimizer()
     loss_fn = model.get_loss_function()
 
-    memory_stats["start"] = torch.cuda.memory_stats()
+    memory_stats["start"] = torch.cuda.max_memory_allocated()
 
     model.train()
-    iteration_timings = []
+    iteration_timings = torch.empty(model.num_steps)
     iterator = iter(dataloader)
-    for _ in range(model.num_steps):
+    for i in range(model.num_steps):
         t0 = time.perf_counter()
 
         inputs, labels = next(iterator)
@@ -65,11 +64,11 @@ def train_torch(
         optimizer.step()
 
         t1 = time.perf_counter()
-        iteration_timings.append(t1 - t0)
+        iteration_timings[i] = t1 - t0
 
-    memory_stats["end"] = torch.cuda.memory_stats()
+    memory_stats["end"] = torch.cuda.max_memory_allocated()
 
-    return model.state_dict(), torch.tensor(iteration_timings), memory_stats
+    return model.state_dict(), iteration_timings, memory_stats
 
 
 def train_fabric(fabric):
@@ -77,7 +76,7 @@ def train_fabric(fabric):
     memory_stats = {}
 
     model = ConvNet()
-    initial_state_dict = deepcopy(model.state_dict())
+    initial_state_dict = {k: v.detach().clone() for k, v in model.state_dict().items()}
 
     optimizer = model.get_optimizer()
     model, optimizer = fabric.setup(model, optimizer)
@@ -86,12 +85,12 @@ def train_fabric(fabric):
     dataloader = fabric.setup_dataloaders(dataloader)
     loss_fn = model.get_loss_function()
 
-    memory_stats["start"] = torch.cuda.memory_stats()
+    memory_stats["start"] = torch.cuda.max_memory_allocated()
 
     model.train()
-    iteration_timings = []
+    iteration_timings = torch.empty(model.num_steps)
     iterator = iter(dataloader)
-    for _ in range(model.num_steps):
+    for i in range(model.num_steps):
         t0 = time.perf_counter()
 
         inputs, labels = next(iterator)
@@ -102,14 +101,14 @@ def train_fabric(fabric):
         optimizer.step()
 
         t1 = time.perf_counter()
-        iteration_timings.append(t1 - t0)
+        iteration_timings[i] = t1 - t0
 
-    memory_stats["end"] = torch.cuda.memory_stats()
+    memory_stats["end"] = torch.cuda.max_memory_allocated()
 
     # check that the model has changed
     assert not is_state_dict_equal(initial_state_dict, model.state_dict())
 
-    return model.state_dict(), torch.tensor(iteration_timings), memory_stats
+    return model.state_dict(), iteration_timings, memory_stats
 
 
 @pytest.mark.flaky(reruns=3)
@@ -18,7 +18,7 @@ from lightning.fabric.accelerators.cuda import _clear_cuda_memory
 
 
 def is_state_dict_equal(state0, state1):
-    return all(torch.equal(w0.cpu(), w1.cpu()) for w0, w1 in zip(state0.values(), state1.values()))
+    return all(torch.equal(w0, w1.to(w0.device)) for w0, w1 in zip(state0.values(), state1.values()))
 
 
 def is_timing_close(timings_torch, timings_fabric, rtol=1e-2, atol=0.1):
@@ -28,9 +28,9 @@ def is_timing_close(timings_torch, timings_fabric, rtol=1e-2, atol=0.1):
     return bool(torch.isclose(torch.median(timings_torch[3:]), torch.median(timings_fabric[3:]), rtol=rtol, atol=atol))
 
 
-def is_cuda_memory_close(memory_stats_torch, memory_stats_fabric):
+def is_cuda_memory_close(peak_memory_torch, peak_memory_fabric):
     # We require Fabric's peak memory usage to be smaller or equal to that of PyTorch
-    return memory_stats_torch["allocated_bytes.all.peak"] >= memory_stats_fabric["allocated_bytes.all.peak"]
+    return peak_memory_torch >= peak_memory_fabric
 
 
 def make_deterministic(warn_only=False):
@@ -13,12 +13,15 @@
 # limitations under the License.
 
 import torch
+import torch.distributed
 import torch.nn as nn
 from lightning.pytorch import LightningModule, Trainer, seed_everything
 from torch.utils.data import DataLoader, DistributedSampler
 
 from parity_pytorch import RunIf
 
+_SYNCBN_DATA = torch.arange(64, dtype=torch.float).view(-1, 1)
+
 
 class SyncBNModule(LightningModule):
     def __init__(self, batch_size):
@@ -42,12 +45,11 @@ class SyncBNModule(LightningModule):
         return torch.optim.SGD(self.parameters(), lr=0.02)
 
     def train_dataloader(self):
-        dataset = torch.arange(64, dtype=torch.float).view(-1, 1)
         # we need to set a distributed sampler ourselves to force shuffle=False
         sampler = DistributedSampler(
-            dataset, num_replicas=self.trainer.world_size, rank=self.trainer.global_rank, shuffle=False
+            _SYNCBN_DATA, num_replicas=self.trainer.world_size, rank=self.trainer.global_rank, shuffle=False
         )
-        return DataLoader(dataset, sampler=sampler, batch_size=self.batch_size)
+        return DataLoader(_SYNCBN_DATA, sampler=sampler, batch_size=self.batch_size)
 
 
 @RunIf(min_cuda_gpus=2, standalone=True)
@@ -78,9 +80,14 @@ def test_sync_batchnorm_parity(tmpdir):
     assert isinstance(model.bn_layer, torch.nn.modules.batchnorm._BatchNorm)
 
     bn_outputs = torch.stack(model.bn_outputs)  # 2 x 4 x 1 on each GPU
-    bn_outputs_multi_device = trainer.strategy.all_gather(bn_outputs).cpu()  # 2 x 2 x 4 x 1
+    # only rank 0 compares the outputs, no need to send them to every rank
+    is_rank_zero = trainer.global_rank == 0
+    gather_list = [torch.empty_like(bn_outputs) for _ in range(trainer.world_size)] if is_rank_zero else None
+    torch.distributed.gather(bn_outputs, gather_list, dst=0)
+
+    if is_rank_zero:
+        bn_outputs_multi_device = torch.stack(gather_list).cpu()  # 2 x 2 x 4 x 1
 
-    if trainer.global_rank == 0:
         # pretend we are now training on a single GPU/process
         # (we are reusing the rank 0 from the previous training)
 
@@ -98,8 +105,7 @@ def test_sync_batchnorm_parity(tmpdir):
 
 def _train_single_process_sync_batchnorm(batch_size, num_steps):
     seed_everything(3)
-    dataset = torch.arange(64, dtype=torch.float).view(-1, 1)
-    train_dataloader = DataLoader(dataset, batch_size=batch_size)
+    train_dataloader = DataLoader(_SYNCBN_DATA, batch_size=batch_size)
     model = SyncBNModule(batch_size=batch_size)
     optimizer = model.configure_optimizers()
     model.train()
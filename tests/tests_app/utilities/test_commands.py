@@ -15,6 +15,8 @@ from lightning.app.testing.helpers import _RunIf
 from lightning.app.utilities.commands.base import ClientCommand, _download_command, _validate_client_command
 from lightning.app.utilities.state import AppState
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class SweepConfig(BaseModel):
@@ -135,16 +137,12 @@ def test_configure_commands(monkeypatch):
     """This test validates command can be used locally with connect and disconnect."""
     process = Process(target=target)
     process.start()
-    time_left = 15
-    while time_left > 0:
-        try:
-            requests.get(f"http://localhost:{APP_SERVER_PORT}/healthz")
-            break
-        except requests.exceptions.ConnectionError:
-            sleep(0.1)
-            time_left -= 0.1
-
-    sleep(0.5)
+    # block on a single request that retries the connection until the app server is up,
+    # the backoff sleeps add up to ~13s before giving up
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(max_retries=Retry(total=8, connect=8, read=0, backoff_factor=0.05)))
+    session.get(f"http://localhost:{APP_SERVER_PORT}/healthz", timeout=5)
+
     monkeypatch.setattr(sys, "argv", ["lightning", "user", "command", "--name=something"])
     connect_app("localhost")
     _run_app_command("localhost", None)
@@ -154,12 +152,7 @@ def test_configure_commands(monkeypatch):
     assert state.names == ["something"]
     monkeypatch.setattr(sys, "argv", ["lightning", "sweep", "--sweep_name=my_name", "--num_trials=1"])
     _run_app_command("localhost", None)
-    time_left = 15
-    while time_left > 0:
-        if process.exitcode == 0:
-            break
-        sleep(0.1)
-        time_left -= 0.1
+    process.join(timeout=15)
     assert process.exitcode == 0
     disconnect_app()
     process.kill()
@@ -38,12 +38,12 @@ def test_deepspeed_multiple_models():
     with fabric.init_module():
         model = BoringModel()
 
-    optimizer = torch.optim.SGD(model.parameters(), lr=0.0001)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.0001, foreach=True)
     model, optimizer = fabric.setup(model, optimizer)
 
     for i in range(2):
         optimizer.zero_grad()
-        x = model(torch.randn(1, 32).to(fabric.device))
+        x = model(torch.randn(1, 32, device=fabric.device))
         loss = x.sum()
         if i == 0:
             # the weights are not initialized with stage 3 until backward is run once
@@ -60,11 +60,11 @@ def test_deepspeed_multiple_models():
 
     fabric.seed_everything(42)
     model_1 = BoringModel()
-    optimizer_1 = torch.optim.SGD(model_1.parameters(), lr=0.0001)
+    optimizer_1 = torch.optim.SGD(model_1.parameters(), lr=0.0001, foreach=True)
 
     fabric.seed_everything(42)
     model_2 = BoringModel()
-    optimizer_2 = torch.optim.SGD(model_2.parameters(), lr=0.0001)
+    optimizer_2 = torch.optim.SGD(model_2.parameters(), lr=0.0001, foreach=True)
 
     for mw_1, mw_2 in zip(model_1.state_dict().values(), model_2.state_dict().values()):
         assert torch.allclose(mw_1, mw_2)
@@ -74,11 +74,9 @@ def test_deepspeed_multiple_models():
 
     # train model_1 first
     fabric.seed_everything(42)
-    data_list = []
-    for _ in range(2):
+    data_list = [torch.randn(1, 32, device=fabric.device) for _ in range(2)]
+    for data in data_list:
         optimizer_1.zero_grad()
-        data = torch.randn(1, 32).to(fabric.device)
-        data_list.append(data)
         x = model_1(data)
         loss = x.sum()
         fabric.backward(loss, model=model_1)
@@ -43,6 +43,14 @@ from torch.utils.data import DataLoader, DistributedSampler, RandomSampler, Samp
 
 from tests_fabric.helpers.runif import RunIf
 
+_MULTI_DEVICE_STRATEGIES = (
+    "dp",
+    "ddp",
+    "ddp_spawn",
+    pytest.param("ddp_fork", marks=RunIf(skip_windows=True)),
+    pytest.param("deepspeed", marks=RunIf(deepspeed=True)),
+)
+
 
 class BoringModel(nn.Module):
     def __init__(self):
@@ -54,6 +62,13 @@ class BoringModel(nn.Module):
         return torch.nn.functional.mse_loss(x, torch.ones_like(x))
 
 
+@pytest.fixture()
+def cuda1_device(monkeypatch):
+    device_mock = PropertyMock(return_value=torch.device("cuda", 1))
+    monkeypatch.setattr(Fabric, "device", device_mock)
+    return device_mock
+
+
 def test_run_input_output():
     """Test that the dynamically patched run() method receives the input arguments and returns the result."""
 
@@ -403,22 +418,17 @@ def test_setup_dataloaders_twice_fails():
         fabric.setup_dataloaders(fabric_dataloader)
 
 
-@mock.patch(
-    "lightning.fabric.fabric.Fabric.device",
-    new_callable=PropertyMock,
-    return_value=torch.device("cuda", 1),
-)
-def test_setup_dataloaders_move_to_device(fabric_device_mock):
+def test_setup_dataloaders_move_to_device(cuda1_device):
     """Test that the setup configures FabricDataLoader to move the data to the device automatically."""
     fabric = Fabric(devices=1)
     fabric_dataloaders = fabric.setup_dataloaders(DataLoader(Mock()), DataLoader(Mock()), move_to_device=False)
     assert all(dl.device is None for dl in fabric_dataloaders)
-    fabric_device_mock.assert_not_called()
+    cuda1_device.assert_not_called()
 
     fabric = Fabric(devices=1)
     fabric_dataloaders = fabric.setup_dataloaders(DataLoader(Mock()), DataLoader(Mock()), move_to_device=True)
     assert all(dl.device == torch.device("cuda", 1) for dl in fabric_dataloaders)
-    fabric_device_mock.assert_called()
+    cuda1_device.assert_called()
 
 
 def test_setup_dataloaders_distributed_sampler_not_needed():
@@ -512,16 +522,7 @@ def test_seed_everything():
     assert os.environ == {"PL_GLOBAL_SEED": "3", "PL_SEED_WORKERS": "1"}
 
 
-@pytest.mark.parametrize(
-    "strategy",
-    [
-        "dp",
-        "ddp",
-        "ddp_spawn",
-        pytest.param("ddp_fork", marks=RunIf(skip_windows=True)),
-        pytest.param("deepspeed", marks=RunIf(deepspeed=True)),
-    ],
-)
+@pytest.mark.parametrize("strategy", _MULTI_DEVICE_STRATEGIES)
 def test_setup_dataloaders_replace_custom_sampler(strategy):
     """Test that asking to replace a custom sampler results in an error when a distributed sampler would be needed."""
     custom_sampler = Mock(spec=Sampler)
@@ -539,24 +540,14 @@ def test_setup_dataloaders_replace_custom_sampler(strategy):
     assert fabric_dataloader.sampler is custom_sampler
 
 
-@pytest.mark.parametrize(
-    "strategy",
-    [
-        "dp",
-        "ddp",
-        "ddp_spawn",
-        pytest.param("ddp_fork", marks=RunIf(skip_windows=True)),
-        pytest.param("deepspeed", marks=RunIf(deepspeed=True)),
-    ],
-)
+@pytest.mark.parametrize("strategy", _MULTI_DEVICE_STRATEGIES)
 @pytest.mark.parametrize("shuffle", [True, False])
 def test_setup_dataloaders_replace_standard_sampler(shuffle, strategy):
     """Test that Fabric replaces the default samplers with DistributedSampler automatically."""
     fabric = Fabric(accelerator="cpu", strategy=strategy, devices=2)
     fabric._launched = True  # pretend we have launched multiple processes
-    is_distributed = hasattr(fabric.strategy, "distributed_sampler_kwargs")
     fabric_dataloader = fabric.setup_dataloaders(DataLoader(range(3), shuffle=shuffle))
-    assert not is_distributed or isinstance(fabric_dataloader.sampler, DistributedSampler)
+    assert isinstance(fabric_dataloader.sampler, DistributedSampler)
 
 
 @pytest.mark.parametrize(
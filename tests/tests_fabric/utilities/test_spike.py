@@ -7,7 +7,7 @@ from lightning.fabric import Fabric
 from lightning.fabric.utilities.spike import _TORCHMETRICS_GREATER_EQUAL_1_0_0, SpikeDetection, TrainingSpikeException
 
 
-def spike_detection_test(fabric, global_rank_spike, spike_value, should_raise):
+def spike_detection_test(fabric, callback, global_rank_spike, spike_value, should_raise):
     loss_vals = [1 / i for i in range(1, 10)]
     if fabric.global_rank == global_rank_spike:
         if spike_value is None:
@@ -16,11 +16,14 @@ def spike_detection_test(fabric, global_rank_spike, spike_value, should_raise):
             loss_vals[4] = spike_value
 
     for i in range(len(loss_vals)):
-        context = pytest.raises(TrainingSpikeException) if i == 4 and should_raise else contextlib.nullcontext()
+        context = (
+            pytest.raises(TrainingSpikeException, match="spike detected in batch 4")
+            if i == 4 and should_raise
+            else contextlib.nullcontext()
+        )
 
         with context:
-            fabric.call(
-                "on_train_batch_end",
+            callback.on_train_batch_end(
                 fabric=fabric,
                 loss=torch.tensor(loss_vals[i], device=fabric.device),
                 batch=None,
@@ -28,158 +31,40 @@ def spike_detection_test(fabric, global_rank_spike, spike_value, should_raise):
             )
 
 
+# (global_rank_spike, spike_value, finite_only), the non-zero ranks only apply to the multi-device run
+_SPIKE_CASES = [
+    (global_rank_spike, spike_value, finite_only)
+    for global_rank_spike in (0, 1)
+    for spike_value in (None, float("inf"), float("-inf"), float("NaN"))
+    for finite_only in (True, False)
+]
+
+
+def spike_detection_cases(fabric, tmp_path):
+    for i, (global_rank_spike, spike_value, finite_only) in enumerate(_SPIKE_CASES):
+        if global_rank_spike >= fabric.world_size:
+            continue
+        # a fresh callback per case, all cases share the launched processes
+        callback = SpikeDetection(exclude_batches_path=tmp_path / str(i), finite_only=finite_only)
+
+        # spike_value == None -> typical spike detection
+        # finite_only -> typical spike detection and raise with NaN +/- inf
+        # if inf -> inf >> other values -> typical spike detection
+        should_raise = spike_value is None or finite_only or spike_value == float("inf")
+        try:
+            spike_detection_test(fabric, callback, global_rank_spike, spike_value, should_raise)
+        except (Exception, pytest.fail.Exception) as ex:
+            case = {"global_rank_spike": global_rank_spike, "spike_value": spike_value, "finite_only": finite_only}
+            raise AssertionError(f"case {i} failed on rank {fabric.global_rank}: {case}") from ex
+
+
 @pytest.mark.flaky(max_runs=3)
 @pytest.mark.parametrize(
-    ("global_rank_spike", "num_devices", "spike_value", "finite_only"),
+    "num_devices",
     [
-        pytest.param(0, 1, None, True),
-        pytest.param(0, 1, None, False),
-        pytest.param(0, 1, float("inf"), True),
-        pytest.param(0, 1, float("inf"), False),
-        pytest.param(0, 1, float("-inf"), True),
-        pytest.param(0, 1, float("-inf"), False),
-        pytest.param(0, 1, float("NaN"), True),
-        pytest.param(0, 1, float("NaN"), False),
-        pytest.param(
-            0,
-            2,
-            None,
-            True,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            0,
-            2,
-            None,
-            False,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            1,
-            2,
-            None,
-            True,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            1,
-            2,
-            None,
-            False,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            0,
-            2,
-            float("inf"),
-            True,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            0,
-            2,
-            float("inf"),
-            False,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            1,
-            2,
-            float("inf"),
-            True,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            1,
-            2,
-            float("inf"),
-            False,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            0,
-            2,
-            float("-inf"),
-            True,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            0,
-            2,
-            float("-inf"),
-            False,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            1,
-            2,
-            float("-inf"),
-            True,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            1,
-            2,
-            float("-inf"),
-            False,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            0,
-            2,
-            float("NaN"),
-            True,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            0,
-            2,
-            float("NaN"),
-            False,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
-        pytest.param(
-            1,
-            2,
-            float("NaN"),
-            True,
-            marks=pytest.mark.skipif(
-                sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
-            ),
-        ),
+        1,
         pytest.param(
-            1,
             2,
-            float("NaN"),
-            False,
             marks=pytest.mark.skipif(
                 sys.platform != "linux", reason="multiprocessing on other platforms takes forever"
             ),
@@ -187,21 +72,6 @@ def spike_detection_test(fabric, global_rank_spike, spike_value, should_raise):
     ],
 )
 @pytest.mark.skipif(not _TORCHMETRICS_GREATER_EQUAL_1_0_0, reason="requires torchmetrics>=1.0.0")
-def test_fabric_spike_detection_integration(tmp_path, global_rank_spike, num_devices, spike_value, finite_only):
-    fabric = Fabric(
-        accelerator="cpu",
-        devices=num_devices,
-        callbacks=[SpikeDetection(exclude_batches_path=tmp_path, finite_only=finite_only)],
-        strategy="ddp_spawn",
-    )
-
-    # spike_value == None -> typical spike detection
-    # finite_only -> typical spike detection and raise with NaN +/- inf
-    # if inf -> inf >> other values -> typical spike detection
-    should_raise = spike_value is None or finite_only or spike_value == float("inf")
-    fabric.launch(
-        spike_detection_test,
-        global_rank_spike=global_rank_spike,
-        spike_value=spike_value,
-        should_raise=should_raise,
-    )
+def test_fabric_spike_detection_integration(tmp_path, num_devices):
+    fabric = Fabric(accelerator="cpu", devices=num_devices, strategy="ddp_spawn")
+    fabric.launch(spike_detection_cases, tmp_path=tmp_path)
@@ -20,6 +20,7 @@ from lightning.pytorch import Trainer
 from lightning.pytorch.core.optimizer import LightningOptimizer
 from lightning.pytorch.demos.boring_classes import BoringModel
 from lightning.pytorch.loops.optimization.automatic import Closure
+from lightning.pytorch.strategies import SingleDeviceStrategy
 from lightning.pytorch.tuner.tuning import Tuner
 from torch.optim import SGD, Adam, Optimizer
 
@@ -71,55 +72,39 @@ def test_init_optimizers_resets_lightning_optimizers(tmp_path):
     compare_optimizers()
 
 
-def test_lightning_optimizer_manual_optimization_and_accumulated_gradients(tmp_path):
-    """Test that the user can use our LightningOptimizer.
-
-    Not recommended.
-
-    """
-
-    class TestModel(BoringModel):
-        def __init__(self):
-            super().__init__()
-            self.automatic_optimization = False
-
-        def training_step(self, batch, batch_idx):
-            opt_1, opt_2 = self.optimizers()
-
-            assert isinstance(opt_1, LightningOptimizer)
-            assert isinstance(opt_2, LightningOptimizer)
-
-            def closure(opt):
-                loss = self.step(batch)
-                opt.zero_grad()
-                self.manual_backward(loss)
+def test_lightning_optimizer_step_counts_with_accumulated_gradients():
+    """Test that the wrapped optimizers returned by ``self.optimizers()`` forward each ``step`` and ``zero_grad`` call
+    to the underlying optimizer when stepping at different frequencies, as done in manual optimization."""
+    model = BoringModel()
+    strategy = SingleDeviceStrategy(device="cpu")
+    strategy.connect(model)
+    model.trainer = Mock(strategy=strategy)
+
+    optimizer_1 = torch.optim.SGD(model.layer.parameters(), lr=0.1)
+    optimizer_2 = torch.optim.Adam(model.layer.parameters(), lr=0.1)
+    strategy.optimizers = [optimizer_1, optimizer_2]
+    opt_1, opt_2 = model.optimizers()
+    assert opt_1.optimizer is optimizer_1
+    assert opt_2.optimizer is optimizer_2
+
+    def closure(opt):
+        loss = model.step(torch.randn(1, 32))
+        opt.zero_grad()
+        loss.backward()
 
+    with patch.multiple(torch.optim.SGD, zero_grad=DEFAULT, step=DEFAULT) as sgd, patch.multiple(
+        torch.optim.Adam, zero_grad=DEFAULT, step=DEFAULT
+    ) as adam:
+        for batch_idx in range(8):
             if batch_idx % 2 == 0:
                 closure(opt_1)
                 opt_1.step()
 
             closure(opt_2)
             step_output = opt_2.step()
-            # check that the step output is returned with manual optimization
-            # since the optimizer is mocked, the step output is a Mock
+            # the wrapper returns the (mocked) optimizer's step output
             assert isinstance(step_output, Mock)
 
-        def configure_optimizers(self):
-            optimizer_1 = torch.optim.SGD(self.layer.parameters(), lr=0.1)
-            optimizer_2 = torch.optim.Adam(self.layer.parameters(), lr=0.1)
-            lr_scheduler = torch.optim.lr_scheduler.StepLR(optimizer_1, step_size=1)
-            return [optimizer_1, optimizer_2], [lr_scheduler]
-
-    model = TestModel()
-    trainer = Trainer(
-        default_root_dir=tmp_path, limit_train_batches=8, limit_val_batches=1, max_epochs=1, enable_model_summary=False
-    )
-
-    with patch.multiple(torch.optim.SGD, zero_grad=DEFAULT, step=DEFAULT) as sgd, patch.multiple(
-        torch.optim.Adam, zero_grad=DEFAULT, step=DEFAULT
-    ) as adam:
-        trainer.fit(model)
-
     assert sgd["step"].call_count == 4
     assert adam["step"].call_count == 8
 
@@ -14,6 +14,7 @@
 import os
 from copy import deepcopy
 from dataclasses import dataclass
+from itertools import islice
 from typing import Dict, Iterator
 from unittest.mock import ANY, Mock
 
@@ -57,10 +58,13 @@ def test_loop_restore():
             super().__init__(trainer)
             self.iteration_count = 0
             self.dataset = dataset
+            self._len = len(dataset)
+            self.outputs = torch.empty(self._len, dtype=torch.int64)
+            self._n = 0
 
         def run(self):
             self.reset()
-            while not self.iteration_count > len(self.dataset):
+            while not self.iteration_count > self._len:
                 try:
                     self.advance()
                     self.iteration_count += 1
@@ -72,11 +76,11 @@ def test_loop_restore():
         def reset(self) -> None:
             self.iter_dataset = iter(self.dataset)
             if self.restarting:
-                for _ in range(self.iteration_count):
-                    next(self.iter_dataset)
+                # consume the already processed items without a Python-level loop
+                next(islice(self.iter_dataset, self.iteration_count, self.iteration_count), None)
                 self.iteration_count += 1
             else:
-                self.outputs = []
+                self._n = 0
 
         def advance(self) -> None:
             value = next(self.iter_dataset)
@@ -84,14 +88,16 @@ def test_loop_restore():
             if self.iteration_count == 5:
                 raise CustomException
 
-            self.outputs.append(value)
+            self.outputs[self._n] = value
+            self._n += 1
 
         def state_dict(self) -> Dict:
-            return {"iteration_count": self.iteration_count, "outputs": self.outputs}
+            return {"iteration_count": self.iteration_count, "outputs": self.outputs[: self._n].tolist()}
 
         def load_state_dict(self, state_dict: Dict) -> None:
             self.iteration_count = state_dict["iteration_count"]
-            self.outputs = state_dict["outputs"]
+            self._n = len(state_dict["outputs"])
+            self.outputs[: self._n] = torch.tensor(state_dict["outputs"], dtype=torch.int64)
 
     trainer = Trainer()
 
@@ -109,7 +115,8 @@ def test_loop_restore():
     loop.run()
 
     assert not loop.restarting
-    assert loop.outputs == list(range(10))
+    assert loop._n == 10
+    assert loop.outputs[: loop._n].tolist() == list(range(10))
 
 
 def test_loop_hierarchy():
@@ -23,7 +23,7 @@ from lightning.pytorch.trainer.trainer import Trainer
 from lightning_utilities.test.warning import no_warning_call
 
 
-def test_no_val_on_train_epoch_loop_restart(tmp_path):
+def test_no_val_on_train_epoch_loop_restart():
     """Test that training validation loop doesn't get triggered at the beginning of a restart."""
     trainer_kwargs = {
         "max_epochs": 1,
@@ -36,7 +36,7 @@ def test_no_val_on_train_epoch_loop_restart(tmp_path):
     trainer = Trainer(**trainer_kwargs)
     model = BoringModel()
     trainer.fit(model)
-    ckpt_path = str(tmp_path / "last.ckpt")
+    ckpt_path = "memory://test_no_val_on_train_epoch_loop_restart/last.ckpt"
     trainer.save_checkpoint(ckpt_path)
 
     trainer_kwargs["max_epochs"] = 2
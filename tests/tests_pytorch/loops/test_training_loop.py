@@ -97,7 +97,14 @@ def test_on_train_batch_start_return_minus_one(max_epochs, batch_idx_, tmp_path)
             return None
 
     model = CurrentModel()
-    trainer = Trainer(default_root_dir=tmp_path, max_epochs=max_epochs, limit_train_batches=10)
+    trainer = Trainer(
+        default_root_dir=tmp_path,
+        max_epochs=max_epochs,
+        limit_train_batches=10,
+        limit_val_batches=1,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
     trainer.fit(model)
     if batch_idx_ > trainer.num_training_batches - 1:
         assert trainer.fit_loop.batch_idx == trainer.num_training_batches - 1
@@ -135,7 +142,7 @@ def test_should_stop_mid_epoch(tmp_path):
 
 
 def test_fit_loop_done_log_messages(caplog):
-    trainer = Mock(spec=Trainer)
+    trainer = Mock(spec_set=("lightning_module", "should_stop"))
     fit_loop = _FitLoop(trainer, max_epochs=1)
 
     trainer.should_stop = False
@@ -94,6 +94,10 @@ def test_amp_gpus(tmp_path, precision, devices):
         devices=devices,
         strategy=("ddp_spawn" if devices > 1 else "auto"),
         precision=precision,
+        limit_train_batches=1,
+        limit_val_batches=1,
+        limit_test_batches=1,
+        limit_predict_batches=1,
     )
 
     model = AMPTestModel()
@@ -136,6 +140,8 @@ def test_amp_gpu_ddp_slurm_managed(tmp_path):
         precision="16-mixed",
         callbacks=[checkpoint],
         logger=logger,
+        limit_train_batches=1,
+        limit_val_batches=1,
     )
     trainer.fit(model)
     assert isinstance(trainer.strategy.cluster_environment, SLURMEnvironment)
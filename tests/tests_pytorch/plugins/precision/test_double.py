@@ -146,7 +146,7 @@ class DoublePrecisionBoringModelComplexBuffer(BoringModel):
 def test_double_precision(tmp_path, boring_model):
     model = boring_model()
 
-    trainer = Trainer(max_epochs=2, default_root_dir=tmp_path, fast_dev_run=2, precision="64-true", log_every_n_steps=1)
+    trainer = Trainer(max_epochs=1, default_root_dir=tmp_path, fast_dev_run=1, precision="64-true", log_every_n_steps=1)
     trainer.fit(model)
     trainer.test(model)
     trainer.predict(model)
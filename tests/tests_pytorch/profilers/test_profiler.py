@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import cProfile
 import logging
 import os
+import pickle
 import platform
 import time
-from copy import deepcopy
+from functools import partial
 from unittest.mock import patch
 
 import numpy as np
@@ -38,12 +40,21 @@ def _get_python_cprofile_total_duration(profile):
     return sum(x.inlinetime for x in profile.getstats())
 
 
-def _sleep_generator(durations):
-    """The profile_iterable method needs an iterable in which we can ensure that we're properly timing how long it
-    takes to call __next__"""
-    for duration in durations:
-        time.sleep(duration)
-        yield duration
+@pytest.fixture()
+def fake_clock(monkeypatch):
+    """Replaces the clocks used by the profilers with a counter that only advances when ``time.sleep`` is called."""
+    now = 0.0
+
+    def sleep(duration):
+        nonlocal now
+        now += duration
+
+    def monotonic():
+        return now
+
+    monkeypatch.setattr(time, "sleep", sleep)
+    monkeypatch.setattr(time, "monotonic", monotonic)
+    monkeypatch.setattr(cProfile, "Profile", partial(cProfile.Profile, monotonic))
 
 
 @pytest.fixture()
@@ -51,17 +62,14 @@ def simple_profiler():
     return SimpleProfiler()
 
 
-@pytest.mark.flaky(reruns=3)
 @pytest.mark.parametrize(("action", "expected"), [("a", [3, 1]), ("b", [2]), ("c", [1])])
-def test_simple_profiler_durations(simple_profiler, action: str, expected: list):
-    """Ensure the reported durations are reasonably accurate."""
+def test_simple_profiler_durations(fake_clock, simple_profiler, action: str, expected: list):
+    """Ensure the reported durations are accurate."""
     for duration in expected:
         with simple_profiler.profile(action):
             time.sleep(duration)
 
-    # different environments have different precision when it comes to time.sleep()
-    # see: https://github.com/Lightning-AI/lightning/issues/796
-    np.testing.assert_allclose(simple_profiler.recorded_durations[action], expected, rtol=0.2)
+    np.testing.assert_allclose(simple_profiler.recorded_durations[action], expected)
 
 
 def test_simple_profiler_overhead(simple_profiler, n_iter=5):
@@ -88,10 +96,10 @@ def test_simple_profiler_value_errors(simple_profiler):
     simple_profiler.stop(action)
 
 
-def test_simple_profiler_deepcopy(tmp_path):
+def test_simple_profiler_pickle(tmp_path):
     simple_profiler = SimpleProfiler(dirpath=tmp_path, filename="test")
     simple_profiler.describe()
-    assert deepcopy(simple_profiler)
+    assert pickle.loads(pickle.dumps(simple_profiler, protocol=pickle.HIGHEST_PROTOCOL))
 
 
 def test_simple_profiler_dirpath(tmp_path):
@@ -100,7 +108,14 @@ def test_simple_profiler_dirpath(tmp_path):
     assert profiler.dirpath is None
 
     model = BoringModel()
-    trainer = Trainer(default_root_dir=tmp_path, max_epochs=1, profiler=profiler, logger=False)
+    trainer = Trainer(
+        default_root_dir=tmp_path,
+        max_epochs=1,
+        limit_train_batches=1,
+        limit_val_batches=1,
+        profiler=profiler,
+        logger=False,
+    )
     trainer.fit(model)
 
     assert trainer.log_dir == str(tmp_path)
@@ -170,8 +185,7 @@ def test_simple_profiler_distributed_files(tmp_path):
     expected = {f"{stage}-profiler-{rank}.txt" for stage in ("fit", "validate", "test") for rank in (0, 1)}
     assert actual == expected
 
-    for f in profiler.dirpath.iterdir():
-        assert f.read_text("utf-8")
+    assert all(f.stat().st_size > 0 for f in profiler.dirpath.iterdir())
 
 
 def test_simple_profiler_logs(tmp_path, caplog, simple_profiler):
@@ -260,18 +274,15 @@ def advanced_profiler(tmp_path):
     return AdvancedProfiler(dirpath=tmp_path, filename="profiler")
 
 
-@pytest.mark.flaky(reruns=3)
 @pytest.mark.parametrize(("action", "expected"), [("a", [3, 1]), ("b", [2]), ("c", [1])])
-def test_advanced_profiler_durations(advanced_profiler, action: str, expected: list):
+def test_advanced_profiler_durations(fake_clock, advanced_profiler, action: str, expected: list):
     for duration in expected:
         with advanced_profiler.profile(action):
             time.sleep(duration)
 
-    # different environments have different precision when it comes to time.sleep()
-    # see: https://github.com/Lightning-AI/lightning/issues/796
     recorded_total_duration = _get_python_cprofile_total_duration(advanced_profiler.profiled_actions[action])
     expected_total_duration = np.sum(expected)
-    np.testing.assert_allclose(recorded_total_duration, expected_total_duration, rtol=0.2)
+    np.testing.assert_allclose(recorded_total_duration, expected_total_duration)
 
 
 @pytest.mark.flaky(reruns=3)
@@ -295,8 +306,7 @@ def test_advanced_profiler_describe(tmp_path, advanced_profiler):
     # log to stdout and print to file
     advanced_profiler.describe()
     path = advanced_profiler.dirpath / f"{advanced_profiler.filename}.txt"
-    data = path.read_text("utf-8")
-    assert len(data) > 0
+    assert path.stat().st_size > 0
 
 
 def test_advanced_profiler_value_errors(advanced_profiler):
@@ -309,9 +319,9 @@ def test_advanced_profiler_value_errors(advanced_profiler):
     advanced_profiler.stop(action)
 
 
-def test_advanced_profiler_deepcopy(advanced_profiler):
+def test_advanced_profiler_pickle(advanced_profiler):
     advanced_profiler.describe()
-    assert deepcopy(advanced_profiler)
+    assert pickle.loads(pickle.dumps(advanced_profiler, protocol=pickle.HIGHEST_PROTOCOL))
 
 
 @pytest.fixture()
@@ -319,6 +329,19 @@ def pytorch_profiler(tmp_path):
     return PyTorchProfiler(dirpath=tmp_path, filename="profiler")
 
 
+@pytest.fixture()
+def trainer_kwargs(tmp_path):
+    # the profiler tests only assert on the profiler output
+    return {
+        "default_root_dir": tmp_path,
+        "max_epochs": 1,
+        "logger": False,
+        "enable_checkpointing": False,
+        "enable_progress_bar": False,
+        "enable_model_summary": False,
+    }
+
+
 @pytest.mark.xfail(raises=AssertionError, reason="TODO: Support after 1.11 profiler added")
 def test_pytorch_profiler_describe(pytorch_profiler):
     """Ensure the profiler won't fail when reporting the summary."""
@@ -328,8 +351,7 @@ def test_pytorch_profiler_describe(pytorch_profiler):
     # log to stdout and print to file
     pytorch_profiler.describe()
     path = pytorch_profiler.dirpath / f"{pytorch_profiler.filename}.txt"
-    data = path.read_text("utf-8")
-    assert len(data) > 0
+    assert path.stat().st_size > 0
 
 
 def test_advanced_profiler_cprofile_deepcopy(tmp_path):
@@ -375,7 +397,7 @@ def test_pytorch_profiler_trainer_ddp(tmp_path, pytorch_profiler):
     assert expected in files
 
     path = pytorch_profiler.dirpath / expected
-    assert path.read_text("utf-8")
+    assert path.stat().st_size > 0
 
     if _KINETO_AVAILABLE:
         files = os.listdir(pytorch_profiler.dirpath)
@@ -388,11 +410,11 @@ def test_pytorch_profiler_trainer_ddp(tmp_path, pytorch_profiler):
 
 @pytest.mark.parametrize("fast_dev_run", [1, 2, 3, 4, 5])
 @pytest.mark.parametrize("boring_model_cls", [ManualOptimBoringModel, BoringModel])
-def test_pytorch_profiler_trainer_fit(fast_dev_run, boring_model_cls, tmp_path):
+def test_pytorch_profiler_trainer_fit(fast_dev_run, boring_model_cls, tmp_path, trainer_kwargs):
     """Ensure that the profiler can be given to the trainer and test step are properly recorded."""
     pytorch_profiler = PyTorchProfiler(dirpath=tmp_path, filename="profile")
     model = boring_model_cls()
-    trainer = Trainer(default_root_dir=tmp_path, max_epochs=1, fast_dev_run=fast_dev_run, profiler=pytorch_profiler)
+    trainer = Trainer(**trainer_kwargs, fast_dev_run=fast_dev_run, profiler=pytorch_profiler)
     trainer.fit(model)
 
     assert sum(
@@ -401,7 +423,7 @@ def test_pytorch_profiler_trainer_fit(fast_dev_run, boring_model_cls, tmp_path):
     )
 
     path = pytorch_profiler.dirpath / f"fit-{pytorch_profiler.filename}.txt"
-    assert path.read_text("utf-8")
+    assert path.stat().st_size > 0
 
     if _KINETO_AVAILABLE:
         files = sorted(file for file in os.listdir(tmp_path) if file.endswith(".json"))
@@ -410,18 +432,24 @@ def test_pytorch_profiler_trainer_fit(fast_dev_run, boring_model_cls, tmp_path):
 
 @pytest.mark.parametrize(("fn", "step_name"), [("test", "test"), ("validate", "validation"), ("predict", "predict")])
 @pytest.mark.parametrize("boring_model_cls", [BoringModel, ManualOptimBoringModel])
-def test_pytorch_profiler_trainer(fn, step_name, boring_model_cls, tmp_path):
+def test_pytorch_profiler_trainer(fn, step_name, boring_model_cls, tmp_path, trainer_kwargs):
     """Ensure that the profiler can be given to the trainer and test step are properly recorded."""
     pytorch_profiler = PyTorchProfiler(dirpath=tmp_path, filename="profile", schedule=None)
     model = boring_model_cls()
     model.predict_dataloader = model.train_dataloader
-    trainer = Trainer(default_root_dir=tmp_path, max_epochs=1, limit_test_batches=2, profiler=pytorch_profiler)
+    trainer = Trainer(
+        **trainer_kwargs,
+        limit_val_batches=1,
+        limit_test_batches=1,
+        limit_predict_batches=1,
+        profiler=pytorch_profiler,
+    )
     getattr(trainer, fn)(model)
 
     assert sum(e.name.endswith(f"{step_name}_step") for e in pytorch_profiler.function_events)
 
     path = pytorch_profiler.dirpath / f"{fn}-{pytorch_profiler.filename}.txt"
-    assert path.read_text("utf-8")
+    assert path.stat().st_size > 0
 
     if _KINETO_AVAILABLE:
         files = sorted(file for file in os.listdir(tmp_path) if file.endswith(".json"))
@@ -508,7 +536,7 @@ def test_register_record_function(tmp_path):
 
 
 @pytest.mark.parametrize("cls", [SimpleProfiler, AdvancedProfiler, PyTorchProfiler])
-def test_profiler_teardown(tmp_path, cls):
+def test_profiler_teardown(tmp_path, cls, trainer_kwargs):
     """This test checks if profiler teardown method is called when trainer is exiting."""
 
     class TestCallback(Callback):
@@ -518,18 +546,18 @@ def test_profiler_teardown(tmp_path, cls):
 
     profiler = cls(dirpath=tmp_path, filename="profiler")
     model = BoringModel()
-    trainer = Trainer(default_root_dir=tmp_path, fast_dev_run=1, profiler=profiler, callbacks=[TestCallback()])
+    trainer = Trainer(**trainer_kwargs, fast_dev_run=1, profiler=profiler, callbacks=[TestCallback()])
     trainer.fit(model)
 
     assert profiler._output_file is None
 
 
-def test_pytorch_profiler_deepcopy(tmp_path):
+def test_pytorch_profiler_pickle(tmp_path):
     pytorch_profiler = PyTorchProfiler(dirpath=tmp_path, filename="profiler", schedule=None)
     pytorch_profiler.start("on_train_start")
     torch.tensor(1)
     pytorch_profiler.describe()
-    assert deepcopy(pytorch_profiler)
+    assert pickle.loads(pickle.dumps(pytorch_profiler, protocol=pickle.HIGHEST_PROTOCOL))
 
 
 @pytest.mark.parametrize(